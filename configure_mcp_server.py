@@ -19,27 +19,24 @@ def main():
     
     # Path to the Claude MCP settings file
     settings_path = os.path.expanduser("~/Library/Application Support/Code/User/globalStorage/saoudrizwan.claude-dev/settings/cline_mcp_settings.json")
-    
+
+    # The Elasticsearch MCP server config, shared by both branches below
+    server_conf = {
+        "command": "python",
+        "args": [os.path.abspath("es_mcp_server.py")],
+        "env": {
+            "ES_CLOUD_ID": es_cloud_id,
+            "ES_API_KEY": es_api_key
+        },
+        "disabled": False,
+        "autoApprove": []
+    }
+
     # Check if the settings file exists
     if not os.path.exists(settings_path):
         # Create the directory if it doesn't exist
         os.makedirs(os.path.dirname(settings_path), exist_ok=True)
-        
-        # Create a new settings file with the Elasticsearch MCP server
-        settings = {
-            "mcpServers": {
-                "elasticsearch": {
-                    "command": "python",
-                    "args": [os.path.abspath("es_mcp_server.py")],
-                    "env": {
-                        "ES_CLOUD_ID": es_cloud_id,
-                        "ES_API_KEY": es_api_key
-                    },
-                    "disabled": False,
-                    "autoApprove": []
-                }
-            }
-        }
+        settings = {}
     else:
         # Load the existing settings file
         try:
@@ -48,22 +45,10 @@ def main():
         except json.JSONDecodeError:
             print(f"Error: Failed to parse the settings file at {settings_path}")
             sys.exit(1)
-        
-        # Add or update the Elasticsearch MCP server
-        if "mcpServers" not in settings:
-            settings["mcpServers"] = {}
-        
-        settings["mcpServers"]["elasticsearch"] = {
-            "command": "python",
-            "args": [os.path.abspath("es_mcp_server.py")],
-            "env": {
-                "ES_CLOUD_ID": es_cloud_id,
-                "ES_API_KEY": es_api_key
-            },
-            "disabled": False,
-            "autoApprove": []
-        }
-    
+
+    # Add or update the Elasticsearch MCP server
+    settings.setdefault("mcpServers", {})["elasticsearch"] = server_conf
+
     # Write the settings file
     try:
         with open(settings_path, "w") as f:
@@ -1,27 +1,40 @@
+# Postponed annotations let the elasticsearch import stay lazy (see below)
+# while signatures still name AsyncElasticsearch.
+from __future__ import annotations
+
 from typing import Any, Dict, List, Optional
+import asyncio
+import itertools
 import json
 import os
 import sys
-from elasticsearch import Elasticsearch
-from mcp.server.fastmcp import FastMCP, Context 
+from mcp.server.fastmcp import FastMCP, Context
 from contextlib import asynccontextmanager
+from collections import Counter
 from collections.abc import AsyncIterator
 from dataclasses import dataclass
 import logging
-import math
+from cachetools import TTLCache
 from dotenv import load_dotenv
 
+# orjson is optional at import time so a missing wheel never blocks startup
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger("elasticsearch-mcp-server")
 logging.basicConfig(level=logging.INFO)
 
+_ENV_LOADED = False
 
-@dataclass
-class ElasticsearchContext:
-    client: Elasticsearch
-
-@asynccontextmanager
-async def elasticsearch_lifespan(server: FastMCP) -> AsyncIterator[ElasticsearchContext]:
-    # Check for MCP_SERVER_CWD and load .env file from there if it exists
+def _load_env() -> None:
+    # Check for MCP_SERVER_CWD and load .env file from there if it exists.
+    # Runs once at module import so short-lived spawns don't repeat the
+    # filesystem probe.
+    global _ENV_LOADED
+    if _ENV_LOADED:
+        return
     mcp_server_cwd = os.environ.get("MCP_SERVER_CWD")
     if mcp_server_cwd:
         custom_env_path = os.path.join(mcp_server_cwd, '.env')
@@ -31,31 +44,76 @@ async def elasticsearch_lifespan(server: FastMCP) -> AsyncIterator[Elasticsearch
         else:
             logger.info(f".env file not found at {custom_env_path}. Using pre-existing environment variables.")
     else:
-        # Optionally, you could still load a .env file from the default location (current working directory)
-        # if MCP_SERVER_CWD is not set, but the request was specific to MCP_SERVER_CWD.
-        # load_dotenv(override=True) # This would load .env from CWD if present
         logger.info("MCP_SERVER_CWD not set. Using pre-existing environment variables or default .env location.")
+    _ENV_LOADED = True
+
+_load_env()
+
+ES_CLOUD_ID = os.environ.get("ES_CLOUD_ID", "")
+ES_API_KEY = os.environ.get("ES_API_KEY", "")
 
-    es_cloud_id = os.environ.get("ES_CLOUD_ID", "")
-    es_api_key = os.environ.get("ES_API_KEY", "")
+def _dumps(obj: Any) -> str:
+    # orjson is considerably faster than stdlib json for the large ES payloads
+    # (mappings, stats, hits) serialized on every tool call.
+    if orjson is not None:
+        # OPT_NON_STR_KEYS keeps parity with stdlib json, which stringifies
+        # non-string dict keys instead of raising.
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, indent=2)
 
-    if not es_cloud_id or not es_api_key:
+def _dumps_value(obj: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+def _canonical_dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(obj, sort_keys=True).encode()
+
+
+@dataclass
+class ElasticsearchContext:
+    client: AsyncElasticsearch
+
+# Set by the lifespan so resource handlers reach the client in O(1) instead of
+# walking mcp.get_context() attribute chains on every request.
+_ES_CLIENT: Optional[AsyncElasticsearch] = None
+
+@asynccontextmanager
+async def elasticsearch_lifespan(server: FastMCP) -> AsyncIterator[ElasticsearchContext]:
+    # Env loading already happened at import; this is a no-op guard.
+    _load_env()
+
+    if not ES_CLOUD_ID or not ES_API_KEY:
         logger.error("ES_CLOUD_ID and ES_API_KEY environment variables are required but not found.")
         raise ValueError("ES_CLOUD_ID and ES_API_KEY environment variables are required but not found.")
     
-    es_client = Elasticsearch(
-        cloud_id=es_cloud_id,
-        api_key=es_api_key
-    )
+    # Deferred imports: elasticsearch and the sidecar module are heavyweight
+    # and would otherwise be paid on every stdio spawn before the MCP
+    # handshake even starts. The lifespan runs once, before any tool call.
+    global NotFoundError
+    from elasticsearch import NotFoundError
+    from es_mcp_sidecar import SidecarClient, create_es_client
+
+    if os.environ.get("ES_MCP_USE_SIDECAR", "").lower() in ("1", "true", "yes"):
+        # A long-lived sidecar owns the TLS connection pool, so MCP restarts
+        # (e.g. IDE reloads) skip the handshake and reuse warm connections.
+        es_client = SidecarClient()
+    else:
+        es_client = create_es_client()
     logger.info("Attempting to connect to Elasticsearch...")
 
+    global _ES_CLIENT
     try:
-        if not es_client.ping():
+        if not await es_client.ping():
             logger.error("Elasticsearch cluster is not reachable.")
             raise ConnectionError("Elasticsearch cluster is not reachable")
         logger.info("Successfully connected to Elasticsearch.")
+        _ES_CLIENT = es_client
         yield ElasticsearchContext(client=es_client)
     finally:
+        _ES_CLIENT = None
         await es_client.close()
         logger.info("Elasticsearch client closed.")
 
@@ -63,6 +121,114 @@ async def elasticsearch_lifespan(server: FastMCP) -> AsyncIterator[Elasticsearch
 # Initialize FastMCP server
 mcp = FastMCP("elasticsearch-mcp-server", lifespan=elasticsearch_lifespan)
 
+# Mappings change rarely, so cache them per index for a short TTL instead of
+# issuing a GET _mapping round-trip on every call.
+_MAPPING_CACHE_TTL = 60
+_MAPPING_CACHE: TTLCache = TTLCache(maxsize=512, ttl=_MAPPING_CACHE_TTL)
+_HIGHLIGHT_CACHE: TTLCache = TTLCache(maxsize=512, ttl=_MAPPING_CACHE_TTL)
+# Serialized mapping payloads: hits skip both the ES round-trip and the
+# re-encode of a large, rarely changing document.
+_MAPPING_JSON_CACHE: TTLCache = TTLCache(maxsize=256, ttl=_MAPPING_CACHE_TTL)
+_MAPPING_CACHE_LOCKS: Dict[str, asyncio.Lock] = {}
+
+# Field types worth highlighting; extend here rather than adding branches below
+_HL_TYPES = frozenset({"text", "match_only_text", "dense_vector"})
+# Immutable tag constants shared by every cached highlight spec
+_HL_PRE = ("<em>",)
+_HL_POST = ("</em>",)
+
+def _build_highlight_spec(properties: Dict[str, Any]) -> Dict[str, Any]:
+    # Derived once per cache fill so the per-field scan stays off the search hot path.
+    text_fields = {
+        field_name: {}
+        for field_name, field_data in properties.items()
+        if field_data.get('type') in _HL_TYPES
+    }
+    return {
+        "fields": text_fields,
+        "pre_tags": _HL_PRE,
+        "post_tags": _HL_POST
+    }
+
+async def _get_mapping_cached(es: AsyncElasticsearch, index: str) -> Dict[str, Any]:
+    cached = _MAPPING_CACHE.get(index)
+    if cached is not None:
+        return cached
+    lock = _MAPPING_CACHE_LOCKS.setdefault(index, asyncio.Lock())
+    async with lock:
+        # Re-check after acquiring the lock so concurrent misses fetch once.
+        cached = _MAPPING_CACHE.get(index)
+        if cached is not None:
+            return cached
+        mapping_response = await es.indices.get_mapping(index=index)
+        mappings = mapping_response.get(index, {}).get('mappings', {})
+        _MAPPING_CACHE[index] = mappings
+        return mappings
+
+async def _get_highlight_spec(es: AsyncElasticsearch, index: str) -> Dict[str, Any]:
+    cached = _HIGHLIGHT_CACHE.get(index)
+    if cached is not None:
+        return cached
+    lock = _MAPPING_CACHE_LOCKS.setdefault(index, asyncio.Lock())
+    async with lock:
+        cached = _HIGHLIGHT_CACHE.get(index)
+        if cached is not None:
+            return cached
+        full = _MAPPING_CACHE.get(index)
+        if full is not None:
+            properties = full.get('properties', {})
+        else:
+            # Only the field types are needed here; filter_path keeps ES from
+            # shipping the entire mapping tree for wide indices.
+            mapping_response = await es.indices.get_mapping(
+                index=index, filter_path=f"{index}.mappings.properties.*.type"
+            )
+            properties = mapping_response.get(index, {}).get('mappings', {}).get('properties', {})
+        spec = _build_highlight_spec(properties)
+        _HIGHLIGHT_CACHE[index] = spec
+        return spec
+
+# The cat API has no offset paging, so the full listing is fetched once and
+# shared across page requests for a short window instead of per call.
+_CAT_INDICES_CACHE: TTLCache = TTLCache(maxsize=1, ttl=15)
+_CAT_INDICES_LOCK = asyncio.Lock()
+
+async def _cat_indices_cached(es: AsyncElasticsearch) -> List[Dict[str, Any]]:
+    async with _CAT_INDICES_LOCK:
+        cached = _CAT_INDICES_CACHE.get("cat_indices")
+        if cached is not None:
+            return cached
+        all_indices = await es.cat.indices(format="json", h="index,health,status,docs.count,store.size", s="index:asc")
+        # Normalize to the response schema once at fill time; page requests
+        # then just slice the cached list instead of rebuilding dicts.
+        normalized = [
+            {
+                "index": row.get("index"),
+                "health": row.get("health"),
+                "status": row.get("status"),
+                "docs_count": row.get("docs.count"),
+                "size": row.get("store.size")
+            }
+            for row in all_indices
+        ]
+        _CAT_INDICES_CACHE["cat_indices"] = normalized
+        return normalized
+
+# Repeated identical queries (UI refinement, re-issued pages) are served from
+# a small short-TTL cache instead of hitting Elasticsearch again.
+_SEARCH_CACHE: TTLCache = TTLCache(maxsize=256, ttl=5)
+_SEARCH_CACHE_LOCK = asyncio.Lock()
+
+def _search_cache_key(query_body: Dict[str, Any]) -> Optional[bytes]:
+    # Returns canonical key bytes, or None when the query must not be cached
+    # (relative date math or pagination past the first page).
+    if query_body.get("from", 0) > 0:
+        return None
+    canonical = _canonical_dumps(query_body)
+    if b"now" in canonical:
+        return None
+    return canonical
+
 # --- Tools remain the same ---
 @mcp.tool()
 async def list_indices(ctx: Context, page: Optional[int] = 1, page_size: Optional[int] = 10) -> str:
@@ -71,30 +237,23 @@ async def list_indices(ctx: Context, page: Optional[int] = 1, page_size: Optiona
         current_page = page if page is not None and page > 0 else 1
 
         es = ctx.request_context.lifespan_context.client
-        all_indices = es.cat.indices(format="json", h="index,health,status,docs.count,store.size", s="index:asc") 
-        
+        all_indices = await _cat_indices_cached(es)
+
         if not all_indices:
             return "No indices found."
 
         total_indices = len(all_indices)
-        total_pages = math.ceil(total_indices / current_page_size)
+        total_pages = (total_indices + current_page_size - 1) // current_page_size
         current_page = max(1, min(current_page, total_pages if total_pages > 0 else 1))
         
         start_index = (current_page - 1) * current_page_size
         end_index = start_index + current_page_size
-        paginated_indices = all_indices[start_index:end_index]
+        indices_info = all_indices[start_index:end_index]
 
-        indices_info = [
-            {
-                "index": index.get("index"),
-                "health": index.get("health"),
-                "status": index.get("status"),
-                "docs_count": index.get("docs.count"),
-                "size": index.get("store.size")
-            }
-            for index in paginated_indices
-        ]
         response_data = {
+            # One serialization pass: the page summary rides inside the JSON
+            # instead of duplicating the same numbers in a text preamble.
+            "summary": f"page {current_page}/{total_pages} ({len(indices_info)}/{total_indices})",
             "total_indices": total_indices,
             "current_page": current_page,
             "page_size": current_page_size,
@@ -102,7 +261,7 @@ async def list_indices(ctx: Context, page: Optional[int] = 1, page_size: Optiona
             "indices_on_page": len(indices_info),
             "indices": indices_info
         }
-        return f"Showing page {current_page} of {total_pages} ({len(indices_info)} of {total_indices} total indices)\n\n{json.dumps(response_data, indent=2)}"
+        return _dumps(response_data)
     except Exception as e:
         logger.error(f"Error in list_indices tool: {str(e)}", exc_info=True)
         return f"Error listing indices: {str(e)}"
@@ -110,79 +269,191 @@ async def list_indices(ctx: Context, page: Optional[int] = 1, page_size: Optiona
 @mcp.tool()
 async def get_mappings(index: str, ctx: Context) -> str: 
     try:
-        es = ctx.request_context.lifespan_context.client
-        mapping_response = es.indices.get_mapping(index=index)
-        mappings = mapping_response.get(index, {}).get('mappings', {})
-        return f"Mappings for index: {index}\n\n{json.dumps(mappings, indent=2)}"
+        payload = _MAPPING_JSON_CACHE.get(("tool", index))
+        if payload is None:
+            es = ctx.request_context.lifespan_context.client
+            mappings = await _get_mapping_cached(es, index)
+            payload = _dumps(mappings)
+            _MAPPING_JSON_CACHE[("tool", index)] = payload
+        return f"Mappings for index: {index}\n\n{payload}"
     except Exception as e:
         logger.error(f"Error in get_mappings tool for index {index}: {str(e)}", exc_info=True)
         return f"Error: {str(e)}"
 
 @mcp.tool()
-async def search(ctx: Context, index: str, query_body: Dict[str, Any]) -> str: 
+async def search(ctx: Context, index: str, query_body: Dict[str, Any], fields: Optional[List[str]] = None) -> str:
     try:
         es = ctx.request_context.lifespan_context.client
-        mapping_response = es.indices.get_mapping(index=index) 
-        index_mappings = mapping_response.get(index, {}).get('mappings', {})
+        canonical = _search_cache_key(query_body)
+        cache_key = (index, canonical, tuple(fields) if fields else None) if canonical is not None else None
+        if cache_key is not None:
+            async with _SEARCH_CACHE_LOCK:
+                cached = _SEARCH_CACHE.get(cache_key)
+            if cached is not None:
+                return cached
         search_request = {"index": index, **query_body}
-        if 'properties' in index_mappings: 
-            text_fields = {}
-            for field_name, field_data in index_mappings['properties'].items():
-                if field_data.get('type') == 'text' or 'dense_vector' in field_data: 
-                    text_fields[field_name] = {}
-            if text_fields:
-                search_request["highlight"] = { 
-                    "fields": text_fields,
-                    "pre_tags": ["<em>"], 
-                    "post_tags": ["</em>"] 
-                }
-        result = es.search(**search_request) 
-        from_value = query_body.get('from', 0) 
-        total_hits = result['hits']['total']['value'] if isinstance(result['hits']['total'], dict) else result['hits']['total'] 
-        response = [f"Total results: {total_hits}, showing {len(result['hits']['hits'])} from position {from_value}"]
-        for hit in result['hits']['hits']: 
-            highlighted_fields = hit.get('highlight', {}) 
-            source_data = hit.get('_source', {}) 
-            hit_text = []
-            for field, highlights in highlighted_fields.items():
-                if highlights and len(highlights) > 0:
-                    hit_text.append(f"{field} (highlighted): {' ... '.join(highlights)}") 
-            for field, value in source_data.items():
-                if field not in highlighted_fields:
-                    hit_text.append(f"{field}: {json.dumps(value)}") 
-            response.append("\n".join(hit_text))
-        return "\n\n---\n\n".join(response)
+        # Push field selection to Elasticsearch so hits only carry what the
+        # caller will actually see; an explicit _source in query_body wins.
+        if fields and "_source" not in query_body:
+            search_request["_source"] = fields
+        highlight_spec = _HIGHLIGHT_CACHE.get(index)
+        if highlight_spec is not None:
+            if highlight_spec["fields"]:
+                search_request["highlight"] = highlight_spec
+            result = await es.search(**search_request)
+        else:
+            # Cold cache: run the trimmed mapping fetch and the search
+            # concurrently instead of back to back. This first response goes
+            # out unhighlighted, but the warmed cache covers every later call.
+            _, result = await asyncio.gather(
+                _get_highlight_spec(es, index),
+                es.search(**search_request)
+            )
+            # Don't cache the unhighlighted response, or identical queries
+            # would keep getting it for the TTL even after the spec warmed.
+            cache_key = None
+        from_value = query_body.get('from', 0)
+        total_hits = result['hits']['total']['value'] if isinstance(result['hits']['total'], dict) else result['hits']['total']
+
+        # FastMCP materializes tool results, so we cannot stream chunks to the
+        # client; format hits lazily instead so only the final string is held.
+        def _iter_sections():
+            yield f"Total results: {total_hits}, showing {len(result['hits']['hits'])} from position {from_value}"
+            for hit in result['hits']['hits']:
+                highlighted_fields = hit.get('highlight', {})
+                source_data = hit.get('_source', {})
+                yield "\n".join(itertools.chain(
+                    (f"{field} (highlighted): {' ... '.join(highlights)}"
+                     for field, highlights in highlighted_fields.items() if highlights),
+                    (f"{field}: {_dumps_value(value)}"
+                     for field, value in source_data.items() if field not in highlighted_fields)
+                ))
+
+        formatted = "\n\n---\n\n".join(_iter_sections())
+        if cache_key is not None:
+            async with _SEARCH_CACHE_LOCK:
+                _SEARCH_CACHE[cache_key] = formatted
+        return formatted
     except Exception as e:
         logger.error(f"Error in search tool for index {index}: {str(e)}", exc_info=True)
         return f"Error: {str(e)}"
 
+_MSEARCH_MAX_BATCH = 50
+_BYTES_PER_MB = 1048576
+# Known-huge _source fields skipped by default; callers pass fields="_source"
+# to fetch everything.
+_SOURCE_DEFAULT_EXCLUDES = ["*embedding*", "*vector*", "content_raw"]
+
 @mcp.tool()
-async def search_with_query_string( 
-    index_name: str, 
-    query_text: str, 
-    fields: str = "_source", 
-    size: int = 10, 
+async def msearch_batch(ctx: Context, requests: List[Dict[str, Any]]) -> str:
+    try:
+        es = ctx.request_context.lifespan_context.client
+        if not requests:
+            return "No search requests provided."
+        response = []
+        # Split oversized batches so a single msearch never floods the search queue.
+        for batch_start in range(0, len(requests), _MSEARCH_MAX_BATCH):
+            batch = requests[batch_start:batch_start + _MSEARCH_MAX_BATCH]
+            body = []
+            for request in batch:
+                body.append({"index": request["index"]})
+                body.append(request["query_body"])
+            result = await es.msearch(body=body)
+            for request, item in zip(batch, result["responses"]):
+                if "error" in item:
+                    response.append(f"Error searching index {request['index']}: {_dumps_value(item['error'])}")
+                    continue
+                total_hits = item['hits']['total']['value'] if isinstance(item['hits']['total'], dict) else item['hits']['total']
+                item_text = [f"Index: {request['index']}, total results: {total_hits}, showing {len(item['hits']['hits'])}"]
+                for hit in item['hits']['hits']:
+                    source_data = hit.get('_source', {})
+                    item_text.append("\n".join(f"{field}: {_dumps_value(value)}" for field, value in source_data.items()))
+                response.append("\n\n".join(item_text))
+        return "\n\n---\n\n".join(response)
+    except Exception as e:
+        logger.error(f"Error in msearch_batch tool: {str(e)}", exc_info=True)
+        return f"Error executing msearch batch: {str(e)}"
+
+@mcp.tool()
+async def search_with_query_string(
+    index_name: str,
+    query_text: str,
+    fields: str = "",
+    size: int = 10,
     from_: int = 0,
-    ctx: Context = None 
+    search_after: Optional[List[Any]] = None,
+    sort: Optional[List[Dict[str, Any]]] = None,
+    ctx: Context = None
 ) -> str:
+    """Search an index with a Lucene query string.
+
+    fields: comma-separated list of _source fields to return. When empty, the
+    full _source is returned minus fields matching *embedding*, *vector* or
+    content_raw, which tend to be large; pass fields="_source" to include
+    them. For deep pagination, pass the previous page's cursor as
+    search_after together with a sort ending in a unique field.
+    """
     try:
         es = ctx.request_context.lifespan_context.client
+        cache_key = None
+        # A caller-supplied sort is a list of dicts (unhashable) and changes
+        # the result order, so those calls bypass the cache entirely.
+        if from_ == 0 and search_after is None and sort is None and "now" not in query_text:
+            cache_key = (index_name, query_text, fields, size)
+            async with _SEARCH_CACHE_LOCK:
+                cached = _SEARCH_CACHE.get(cache_key)
+            if cached is not None:
+                return cached
         query = {
-            "query": {"query_string": {"query": query_text}}, 
-            "size": size, 
-            "from": from_ 
+            "query": {"query_string": {"query": query_text}},
+            "size": size
         }
-        if fields and fields != "_source": 
+        # search_after needs a total order that is unique per document. There
+        # is no safe server-side default: _doc is only a per-shard ordinal (two
+        # shards both have doc 0, so pages silently skip documents) and _id
+        # fielddata is disabled by default on 8.x, so an _id sort would 400.
+        # The caller must supply a sort ending in a unique field; a point-in-
+        # time search (whose implicit _shard_doc tiebreaker is safe) is the
+        # alternative for callers that need consistency across refreshes.
+        if search_after is not None and not sort:
+            return (
+                "Error: search_after requires an explicit sort ending in a unique field, "
+                'e.g. sort=[{"timestamp": "desc"}, {"doc_id": "asc"}]. '
+                "Without one, pages can silently skip documents on multi-shard indices."
+            )
+        if sort:
+            query["sort"] = sort
+        if search_after is not None:
+            # Cursor paging costs O(page_size) at any depth; from+size re-sorts
+            # and skips the whole prefix on every shard and caps at
+            # index.max_result_window.
+            query["search_after"] = search_after
+            from_ = 0
+        else:
+            query["from"] = from_
+        if fields and fields != "_source":
             query["_source"] = fields.split(",")
-        results = es.search(index=index_name, body=query) 
-        hits = results["hits"]["hits"] 
-        total = results["hits"]["total"]["value"] 
-        formatted = f"Found {total} documents. Showing {from_ + 1}-{min(from_ + size, total)}:\n\n" 
-        for i, hit in enumerate(hits, 1):
-            formatted += f"Result {from_ + i}. Score: {hit['_score']}\n" 
-            formatted += f"ID: {hit['_id']}\n" 
-            formatted += "Content:\n"
-            formatted += json.dumps(hit["_source"], indent=2) + "\n\n" 
+        elif not fields:
+            # Default projection: exclude embedding-sized blobs so hits stay
+            # small unless the caller asks for the full _source.
+            query["_source"] = {"excludes": _SOURCE_DEFAULT_EXCLUDES}
+        results = await es.search(index=index_name, body=query)
+        hits = results["hits"]["hits"]
+        total = results["hits"]["total"]["value"]
+        # Yield parts lazily and join once; += on str is O(n^2) over large result sets.
+        def _iter_parts():
+            yield f"Found {total} documents. Showing {from_ + 1}-{min(from_ + size, total)}:\n\n"
+            for i, hit in enumerate(hits, 1):
+                yield f"Result {from_ + i}. Score: {hit['_score']}\nID: {hit['_id']}\nContent:\n"
+                yield _dumps(hit["_source"])
+                yield "\n\n"
+            if hits and "sort" in hits[-1]:
+                yield f"Next page: pass search_after={_dumps_value(hits[-1]['sort'])}\n"
+
+        formatted = "".join(_iter_parts())
+        if cache_key is not None:
+            async with _SEARCH_CACHE_LOCK:
+                _SEARCH_CACHE[cache_key] = formatted
         return formatted
     except Exception as e:
         logger.error(f"Error in search_with_query_string for index {index_name}: {str(e)}", exc_info=True)
@@ -192,10 +463,16 @@ async def search_with_query_string(
 async def get_index_stats(index_name: str, ctx: Context) -> str: 
     try:
         es = ctx.request_context.lifespan_context.client
-        stats = es.indices.stats(index=index_name) 
+        # Only four counters are reported; filter_path keeps ES from shipping
+        # the full per-shard stats document.
+        stats = await es.indices.stats(
+            index=index_name,
+            metric=["docs", "store", "indexing", "search"],
+            filter_path="_all.primaries.docs.count,_all.primaries.store.size_in_bytes,_all.primaries.indexing.index_total,_all.primaries.search.query_total"
+        )
         formatted = f"Statistics for index: {index_name}\n\n"
         formatted += f"Documents: {stats['_all']['primaries']['docs']['count']}\n" 
-        formatted += f"Size: {stats['_all']['primaries']['store']['size_in_bytes'] / 1024 / 1024:.2f} MB\n" 
+        formatted += f"Size: {stats['_all']['primaries']['store']['size_in_bytes'] / _BYTES_PER_MB:.2f} MB\n"
         formatted += f"Indexing operations: {stats['_all']['primaries']['indexing']['index_total']}\n" 
         formatted += f"Search operations: {stats['_all']['primaries']['search']['query_total']}\n" 
         return formatted
@@ -205,74 +482,84 @@ async def get_index_stats(index_name: str, ctx: Context) -> str:
 
 # --- Resources ---
 @mcp.resource("elasticsearch://index/{index_name}", name="Elasticsearch Index Information", description="Get information about a specific Elasticsearch index")
-async def get_index_resource(index_name: str) -> str: 
-    ctx = mcp.get_context() 
+async def get_index_resource(index_name: str) -> str:
     try:
-        if not hasattr(ctx, 'request_context') or not hasattr(ctx.request_context, 'lifespan_context'):
-            logger.error("Context is not properly initialized in get_index_resource.")
-            return json.dumps({"error": "Internal server error: Context not initialized"}, indent=2)
-        es = ctx.request_context.lifespan_context.client
-        if not es.indices.exists(index=index_name): 
-            return f"Index '{index_name}' does not exist"
-        index_info = es.indices.get(index=index_name) 
-        stats = es.indices.stats(index=index_name) 
+        es = _ES_CLIENT
+        if es is None:
+            logger.error("Elasticsearch client is not initialized in get_index_resource.")
+            return _dumps({"error": "Internal server error: ES client not initialized"})
+        # No exists() pre-check: the fetch itself raises NotFoundError for a
+        # missing index, so the extra round-trip buys nothing.
+        # The two fetches are independent; run them concurrently so latency is
+        # max(rtt) instead of the sum.
+        index_info, stats = await asyncio.gather(
+            es.indices.get(index=index_name),
+            es.indices.stats(
+                index=index_name,
+                metric=["docs", "store"],
+                filter_path="_all.primaries.docs.count,_all.primaries.store.size_in_bytes"
+            )
+        )
+        size_bytes = stats['_all']['primaries']['store']['size_in_bytes']
         result = {
             "name": index_name,
-            "settings": index_info.get(index_name, {}).get("settings", {}), 
+            "settings": index_info.get(index_name, {}).get("settings", {}),
             "stats": {
-                "docs_count": stats['_all']['primaries']['docs']['count'], 
-                "size_bytes": stats['_all']['primaries']['store']['size_in_bytes'], 
-                "size_mb": round(stats['_all']['primaries']['store']['size_in_bytes'] / 1024 / 1024, 2) 
+                "docs_count": stats['_all']['primaries']['docs']['count'],
+                "size_bytes": size_bytes,
+                "size_mb": round(size_bytes / _BYTES_PER_MB, 2)
             }
         }
-        return json.dumps(result, indent=2)
+        return _dumps(result)
+    except NotFoundError:
+        return f"Index '{index_name}' does not exist"
     except Exception as e:
         logger.error(f"Error in get_index_resource for index {index_name}: {str(e)}", exc_info=True)
-        return json.dumps({"error": f"Error retrieving index information: {str(e)}"}, indent=2)
+        return _dumps({"error": f"Error retrieving index information: {str(e)}"})
 
 @mcp.resource("elasticsearch://mapping/{index_name}", name="Elasticsearch Mapping Information", description="Get mapping information for a specific Elasticsearch index")
-async def get_mapping_resource(index_name: str) -> str: 
-    ctx = mcp.get_context() 
+async def get_mapping_resource(index_name: str) -> str:
     try:
-        if not hasattr(ctx, 'request_context') or not hasattr(ctx.request_context, 'lifespan_context'):
-            logger.error("Context is not properly initialized in get_mapping_resource.")
-            return json.dumps({"error": "Internal server error: Context not initialized"}, indent=2)
-        es = ctx.request_context.lifespan_context.client
-        if not es.indices.exists(index=index_name): 
-            return f"Index '{index_name}' does not exist"
-        mapping_response = es.indices.get_mapping(index=index_name) 
-        mappings = mapping_response.get(index_name, {}).get('mappings', {}) 
+        payload = _MAPPING_JSON_CACHE.get(("resource", index_name))
+        if payload is not None:
+            return payload
+        es = _ES_CLIENT
+        if es is None:
+            logger.error("Elasticsearch client is not initialized in get_mapping_resource.")
+            return _dumps({"error": "Internal server error: ES client not initialized"})
+        mappings = await _get_mapping_cached(es, index_name)
+        properties = mappings.get("properties", {})
         result = {
             "index": index_name,
-            "mappings": mappings, 
-            "field_count": len(mappings.get("properties", {})) if "properties" in mappings else 0, 
-            "field_types": {} 
+            "mappings": mappings,
+            "field_count": len(properties),
+            # Counter tallies in C, one pass over the fields
+            "field_types": dict(Counter(field_data.get("type", "unknown") for field_data in properties.values()))
         }
-        if "properties" in mappings: 
-            for field_name, field_data in mappings["properties"].items():
-                field_type = field_data.get("type", "unknown") 
-                result["field_types"][field_type] = result["field_types"].get(field_type, 0) + 1
-        return json.dumps(result, indent=2)
+        payload = _dumps(result)
+        _MAPPING_JSON_CACHE[("resource", index_name)] = payload
+        return payload
+    except NotFoundError:
+        return f"Index '{index_name}' does not exist"
     except Exception as e:
         logger.error(f"Error in get_mapping_resource for index {index_name}: {str(e)}", exc_info=True)
-        return json.dumps({"error": f"Error retrieving mapping information: {str(e)}"}, indent=2)
+        return _dumps({"error": f"Error retrieving mapping information: {str(e)}"})
 
 @mcp.resource("elasticsearch://indices", name="Elasticsearch Indices List", description="List all Elasticsearch indices with pagination")
-async def list_indices_resource() -> str: 
-    ctx = mcp.get_context() 
+async def list_indices_resource() -> str:
     page = 1
     page_size = 10
     try:
-        if not hasattr(ctx, 'request_context') or \
-           not hasattr(ctx.request_context, 'lifespan_context') or \
-           not hasattr(ctx.request_context.lifespan_context, 'client'):
-            logger.error("Context or Elasticsearch client is not properly initialized in list_indices_resource.")
-            return json.dumps({"error": "Internal server error: Context or ES client not initialized"}, indent=2)
+        es = _ES_CLIENT
+        if es is None:
+            logger.error("Elasticsearch client is not initialized in list_indices_resource.")
+            return _dumps({"error": "Internal server error: ES client not initialized"})
 
         params_source = None
+        ctx = mcp.get_context()
         if hasattr(ctx.request_context, 'tool_input') and isinstance(ctx.request_context.tool_input, dict):
             params_source = ctx.request_context.tool_input
-        
+
         if params_source:
             raw_page = params_source.get('page')
             raw_page_size = params_source.get('page_size')
@@ -289,36 +576,30 @@ async def list_indices_resource() -> str:
         if page <= 0:
             logger.warning(f"Non-positive 'page' parameter value {page} received. Resetting to default 1.")
             page = 1
-            
-        es = ctx.request_context.lifespan_context.client
-        all_indices = es.cat.indices(format="json", h="index,health,status,docs.count,store.size", s="index:asc") 
+
+        all_indices = await _cat_indices_cached(es)
 
         if not all_indices:
-            return json.dumps({
+            return _dumps({
                 "total_indices": 0, "current_page": page, "page_size": page_size,
                 "total_pages": 0, "indices_on_page": 0, "indices": []
-            }, indent=2)
+            })
 
         total_indices = len(all_indices)
-        total_pages = math.ceil(total_indices / page_size)
+        total_pages = (total_indices + page_size - 1) // page_size
         current_page = max(1, min(page, total_pages if total_pages > 0 else 1))
         start_index = (current_page - 1) * page_size
         end_index = start_index + page_size
-        paginated_indices = all_indices[start_index:end_index]
-        
-        indices_info = [
-            {"index": index.get("index"), "health": index.get("health"), "status": index.get("status"),
-             "docs_count": index.get("docs.count"), "size": index.get("store.size")}
-            for index in paginated_indices
-        ]
+        indices_info = all_indices[start_index:end_index]
+
         response_data = {
             "total_indices": total_indices, "current_page": current_page, "page_size": page_size,
             "total_pages": total_pages, "indices_on_page": len(indices_info), "indices": indices_info
         }
-        return json.dumps(response_data, indent=2)
+        return _dumps(response_data)
     except Exception as e:
         logger.error(f"Error in list_indices_resource: {str(e)}", exc_info=True) 
-        return json.dumps({"error": f"Error listing indices: {str(e)}"}, indent=2)
+        return _dumps({"error": f"Error listing indices: {str(e)}"})
 
 
 if __name__ == "__main__":
@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+"""
+Long-lived sidecar that owns the Elasticsearch client so short-lived MCP
+server processes (respawned over stdio by the IDE) do not pay the TLS
+handshake and cluster ping on every restart.
+
+Protocol: Unix domain socket, 4-byte big-endian length prefix followed by a
+JSON-encoded request {"id": 7, "method": "indices.get_mapping", "kwargs": ...}.
+Responses are {"id": 7, "ok": true, "result": ...} or {"id": 7, "ok": false,
+"error": {...}}; the echoed id lets in-flight calls overlap and complete out
+of order.
+"""
+import asyncio
+import json
+import logging
+import os
+import struct
+import subprocess
+import sys
+import time
+from types import SimpleNamespace
+from typing import Any, Dict
+
+from elasticsearch import AsyncElasticsearch, NotFoundError
+from elasticsearch.serializer import JsonSerializer
+
+# orjson is optional here too, matching es_mcp_server: without the wheel the
+# frames and the client serializer fall back to stdlib json.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger("elasticsearch-mcp-sidecar")
+
+_CACHE_DIR = os.path.expanduser("~/.cache/es_mcp")
+SIDECAR_SOCKET_PATH = os.path.join(_CACHE_DIR, "sidecar.sock")
+SIDECAR_LOG_PATH = os.path.join(_CACHE_DIR, "sidecar.log")
+_IDLE_TIMEOUT = 15 * 60  # shut down after 15 minutes without a request
+
+# Client API surface the MCP server is allowed to proxy.
+_ALLOWED_METHODS = frozenset({
+    "ping", "search", "msearch",
+    "cat.indices",
+    "indices.get", "indices.get_mapping", "indices.stats", "indices.exists",
+})
+
+
+class OrjsonSerializer(JsonSerializer):
+    """JSON codec backed by orjson; response parsing dominates CPU on large
+    search results and full mappings."""
+
+    def loads(self, data):
+        return orjson.loads(data)
+
+    def dumps(self, data):
+        if isinstance(data, bytes):
+            return data
+        if isinstance(data, str):
+            return data.encode("utf-8")
+        return orjson.dumps(data)
+
+
+def create_es_client() -> AsyncElasticsearch:
+    """Build the shared AsyncElasticsearch client from environment variables."""
+    es_cloud_id = os.environ.get("ES_CLOUD_ID", "")
+    es_api_key = os.environ.get("ES_API_KEY", "")
+    if not es_cloud_id or not es_api_key:
+        raise ValueError("ES_CLOUD_ID and ES_API_KEY environment variables are required but not found.")
+    try:
+        pool_maxsize = int(os.environ.get("ES_POOL_MAXSIZE", "32"))
+    except ValueError:
+        logger.warning("Invalid ES_POOL_MAXSIZE value, falling back to 32.")
+        pool_maxsize = 32
+    client_kwargs = {
+        "cloud_id": es_cloud_id,
+        "api_key": es_api_key,
+        "connections_per_node": pool_maxsize,
+        "http_compress": True,
+        "request_timeout": 30,
+        "retry_on_timeout": True
+    }
+    if orjson is not None:
+        client_kwargs["serializer"] = OrjsonSerializer()
+    return AsyncElasticsearch(**client_kwargs)
+
+
+def _resolve(client: AsyncElasticsearch, dotted: str):
+    obj = client
+    for part in dotted.split("."):
+        obj = getattr(obj, part)
+    return obj
+
+
+async def _handle_request(es: AsyncElasticsearch, request: Dict[str, Any]) -> Dict[str, Any]:
+    method = request.get("method")
+    if method not in _ALLOWED_METHODS:
+        return {"ok": False, "error": {"type": "ValueError", "message": f"Method not allowed: {method}"}}
+    try:
+        result = await _resolve(es, method)(**request.get("kwargs", {}))
+        body = result.body if hasattr(result, "body") else result
+        return {"ok": True, "result": body}
+    except NotFoundError as e:
+        return {"ok": False, "error": {"type": "NotFoundError", "message": str(e)}}
+    except Exception as e:
+        return {"ok": False, "error": {"type": type(e).__name__, "message": str(e)}}
+
+
+def _encode_payload(payload: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode()
+
+
+def _decode_payload(data: bytes) -> Dict[str, Any]:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+async def _read_frame(reader: asyncio.StreamReader) -> Dict[str, Any]:
+    header = await reader.readexactly(4)
+    (length,) = struct.unpack(">I", header)
+    return _decode_payload(await reader.readexactly(length))
+
+
+def _write_frame(writer: asyncio.StreamWriter, payload: Dict[str, Any]) -> None:
+    data = _encode_payload(payload)
+    writer.write(struct.pack(">I", len(data)) + data)
+
+
+async def serve() -> None:
+    es = create_es_client()
+    if not await es.ping():
+        await es.close()
+        raise ConnectionError("Elasticsearch cluster is not reachable")
+    logger.info("Sidecar connected to Elasticsearch.")
+
+    os.makedirs(_CACHE_DIR, exist_ok=True)
+    if os.path.exists(SIDECAR_SOCKET_PATH):
+        # Two clients racing past the connect failure both spawn a sidecar;
+        # probe before unlinking so the loser defers to a live winner instead
+        # of yanking its socket out from under it.
+        try:
+            _, probe_writer = await asyncio.open_unix_connection(SIDECAR_SOCKET_PATH)
+            probe_writer.close()
+            logger.info("Another sidecar already owns the socket, exiting.")
+            await es.close()
+            return
+        except (ConnectionRefusedError, FileNotFoundError):
+            # Stale socket from a dead sidecar; safe to replace.
+            os.unlink(SIDECAR_SOCKET_PATH)
+    last_activity = time.monotonic()
+
+    async def handle_connection(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        nonlocal last_activity
+        write_lock = asyncio.Lock()
+        in_flight: set = set()
+
+        async def respond(request: Dict[str, Any]) -> None:
+            response = await _handle_request(es, request)
+            # Echo the request id so the client can demultiplex
+            response["id"] = request.get("id")
+            async with write_lock:
+                _write_frame(writer, response)
+                await writer.drain()
+
+        try:
+            while True:
+                try:
+                    request = await _read_frame(reader)
+                except (asyncio.IncompleteReadError, ConnectionResetError):
+                    break
+                last_activity = time.monotonic()
+                # One task per request: slow ES calls don't block the next frame
+                task = asyncio.create_task(respond(request))
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
+        finally:
+            for task in in_flight:
+                task.cancel()
+            writer.close()
+
+    server = await asyncio.start_unix_server(handle_connection, path=SIDECAR_SOCKET_PATH)
+    # Remember which socket file this process bound, so shutdown doesn't
+    # unlink a replacement bound by a newer sidecar in the meantime.
+    socket_inode = os.stat(SIDECAR_SOCKET_PATH).st_ino
+    logger.info(f"Sidecar listening on {SIDECAR_SOCKET_PATH}")
+    try:
+        async with server:
+            while time.monotonic() - last_activity < _IDLE_TIMEOUT:
+                await asyncio.sleep(30)
+            logger.info("Sidecar idle timeout reached, shutting down.")
+    finally:
+        await es.close()
+        try:
+            if os.stat(SIDECAR_SOCKET_PATH).st_ino == socket_inode:
+                os.unlink(SIDECAR_SOCKET_PATH)
+        except FileNotFoundError:
+            pass
+
+
+class _NamespaceProxy:
+    """Stands in for client.cat / client.indices on the proxying side."""
+
+    def __init__(self, client: "SidecarClient", prefix: str):
+        self._client = client
+        self._prefix = prefix
+
+    def __getattr__(self, name: str):
+        method = f"{self._prefix}.{name}"
+
+        async def _call(**kwargs: Any) -> Any:
+            return await self._client.call(method, kwargs)
+
+        return _call
+
+
+class SidecarClient:
+    """Async stand-in for AsyncElasticsearch that proxies calls over the sidecar UDS.
+
+    Connects lazily and spawns the sidecar process if no socket is live, so the
+    first MCP tool call after an IDE restart reuses the sidecar's warm
+    connection pool instead of doing a fresh TLS handshake.
+    """
+
+    def __init__(self, socket_path: str = SIDECAR_SOCKET_PATH):
+        self._socket_path = socket_path
+        self._reader: asyncio.StreamReader = None
+        self._writer: asyncio.StreamWriter = None
+        self._send_lock = asyncio.Lock()
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._next_id = 0
+        self._read_task: asyncio.Task = None
+        self.cat = _NamespaceProxy(self, "cat")
+        self.indices = _NamespaceProxy(self, "indices")
+
+    async def _open(self) -> bool:
+        try:
+            self._reader, self._writer = await asyncio.open_unix_connection(self._socket_path)
+        except (ConnectionRefusedError, FileNotFoundError):
+            return False
+        self._read_task = asyncio.get_running_loop().create_task(self._read_loop())
+        return True
+
+    async def _connect(self) -> None:
+        if self._writer is not None:
+            return
+        if await self._open():
+            return
+        logger.info("Sidecar not running, spawning it.")
+        # The sidecar must not inherit this process's stdio: the MCP server
+        # speaks JSON-RPC over stdin/stdout, and any stray byte from the child
+        # would corrupt the protocol stream. Its logs go to SIDECAR_LOG_PATH.
+        subprocess.Popen(
+            [sys.executable, os.path.abspath(__file__)],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True
+        )
+        for _ in range(50):
+            await asyncio.sleep(0.2)
+            if await self._open():
+                return
+        raise ConnectionError("Timed out waiting for the Elasticsearch sidecar to start")
+
+    async def _read_loop(self) -> None:
+        # Dispatches responses to their waiting calls by id, so any number of
+        # requests can be in flight on the one connection.
+        try:
+            while True:
+                response = await _read_frame(self._reader)
+                future = self._pending.pop(response.get("id"), None)
+                if future is not None and not future.done():
+                    future.set_result(response)
+        except (asyncio.IncompleteReadError, ConnectionResetError, asyncio.CancelledError):
+            pass
+        finally:
+            # Fail whatever is still in flight so callers don't hang forever.
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("Sidecar connection closed"))
+            self._pending.clear()
+            self._reader = None
+            self._writer = None
+            self._read_task = None
+
+    async def call(self, method: str, kwargs: Dict[str, Any]) -> Any:
+        # The lock only covers connect + write; the response is awaited
+        # outside it, so concurrent tool calls overlap inside the sidecar.
+        async with self._send_lock:
+            await self._connect()
+            request_id = self._next_id
+            self._next_id += 1
+            future = asyncio.get_running_loop().create_future()
+            self._pending[request_id] = future
+            _write_frame(self._writer, {"id": request_id, "method": method, "kwargs": kwargs})
+            await self._writer.drain()
+        response = await future
+        if response.get("ok"):
+            return response.get("result")
+        error = response.get("error", {})
+        if error.get("type") == "NotFoundError":
+            raise NotFoundError(error.get("message", "not found"), SimpleNamespace(status=404), None)
+        raise RuntimeError(f"{error.get('type', 'Error')}: {error.get('message', 'unknown sidecar error')}")
+
+    async def ping(self) -> bool:
+        try:
+            return bool(await self.call("ping", {}))
+        except Exception as e:
+            logger.error(f"Sidecar ping failed: {str(e)}")
+            return False
+
+    async def search(self, **kwargs: Any) -> Any:
+        return await self.call("search", kwargs)
+
+    async def msearch(self, **kwargs: Any) -> Any:
+        return await self.call("msearch", kwargs)
+
+    async def close(self) -> None:
+        # The sidecar deliberately outlives this process; just drop the connection.
+        if self._read_task is not None:
+            self._read_task.cancel()
+        if self._writer is not None:
+            self._writer.close()
+
+
+if __name__ == "__main__":
+    # Detached from the spawning MCP server's stdio, so log to a file.
+    os.makedirs(_CACHE_DIR, exist_ok=True)
+    logging.basicConfig(
+        level=logging.INFO,
+        filename=SIDECAR_LOG_PATH,
+        format="%(asctime)s %(name)s %(levelname)s %(message)s"
+    )
+    asyncio.run(serve())